@@ -5,19 +5,58 @@ A web app that scrapes websites and detects login/authentication components.
 Run this file and open http://localhost:5000 in your browser.
 
 Usage:
-    pip install flask requests beautifulsoup4 playwright
+    pip install flask requests beautifulsoup4 lxml cachetools xxhash orjson flask-compress playwright
     playwright install chromium
     python app.py
 """
 
-from flask import Flask, request, jsonify
-from bs4 import BeautifulSoup, Comment
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from bs4 import BeautifulSoup, Comment, NavigableString, SoupStrainer, Tag
+from cachetools import TTLCache
 import requests as http_requests
+from requests.adapters import HTTPAdapter
+import orjson
+import xxhash
 from urllib.parse import urlparse
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import asyncio
+import atexit
+import gzip
+import hashlib
+import os
 import re
+import shutil
+import tempfile
+import threading
 import time
 
+
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=str), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config.update(
+    COMPRESS_MIMETYPES=['text/html', 'text/css', 'application/json',
+                        'application/javascript', 'application/x-ndjson'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_LEVEL=6,
+    # Compressing the live NDJSON stream would buffer lines inside the
+    # compressor and defeat the incremental rendering on the client.
+    COMPRESS_STREAMS=False,
+)
+Compress(app)
 
 AUTH_KEYWORDS = [
     'login', 'log-in', 'log_in', 'signin', 'sign-in', 'sign_in',
@@ -42,67 +81,291 @@ DEFAULT_SITES = [
 ]
 
 
+SCAN_CACHE = TTLCache(maxsize=1024, ttl=300)
+NDJSON_TYPE = 'application/x-ndjson; charset=utf-8'
+
+# The full /api/scan-defaults NDJSON body from the last error-free run.
+DEFAULTS_TTL = 300
+_defaults_cache = {'ts': 0, 'body': None}
+SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='scan')
+DETECT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='detect')
+
+# Scans currently running, keyed by URL, so concurrent requests for the same
+# URL wait on one fetch instead of each starting their own.
+_inflight = {}
+_scan_lock = threading.Lock()
+
+BROWSER_ARGS = ['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
+
+# The browser keeps one persistent context on disk so cookies, cached
+# connections and Chromium's caches survive between scans. Chromium locks
+# its profile, so each server worker process gets its own directory.
+PROFILE_PREFIX = 'pw-profile-'
+
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+
+# Server-rendered login pages are fetched over plain HTTP first; the browser
+# is only used when the static markup shows no sign of a login form.
+HTTP = http_requests.Session()
+HTTP.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=1))
+HTTP.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=1))
+HTTP.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'en-US,en;q=0.9'})
+
+STATIC_TIMEOUT = 10
+STATIC_AUTH_RE = re.compile(
+    r'<input\b[^>]*\btype\s*=\s*["\']?password'
+    r'|<form\b[^>]*\baction\s*=\s*["\']?[^"\'\s>]*(?:login|signin|sign-in|session)',
+    re.I,
+)
+# Markup the browser never renders as the page's UI; a noscript fallback form
+# or a form inside a script string must not skip the browser render.
+STATIC_HIDDEN_RE = re.compile(r'<(script|noscript|template)\b.*?</\1\s*>|<!--.*?-->', re.I | re.S)
+
+# A single Chromium is driven by async Playwright on a dedicated event loop
+# thread; scans from any request thread run as concurrent pages on it.
+_browser_lock = threading.Lock()
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _sweep_stale_profiles():
+    # Workers killed by the server's timeout never run atexit, so drop any
+    # profile whose owning process is gone before creating a new one.
+    tmp = tempfile.gettempdir()
+    for name in os.listdir(tmp):
+        if not name.startswith(PROFILE_PREFIX):
+            continue
+        pid, sep, _ = name[len(PROFILE_PREFIX):].partition('-')
+        if not (sep and pid.isdigit() and int(pid) > 0):
+            continue
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            shutil.rmtree(os.path.join(tmp, name), ignore_errors=True)
+        except PermissionError:
+            pass
+
+
+async def _get_context():
+    from playwright.async_api import async_playwright
+
+    state = app.extensions.setdefault('playwright', {})
+    # Created here, on the browser loop, so the lock binds to that loop on
+    # Python versions where asyncio primitives capture a loop at creation.
+    if 'launch_lock' not in state:
+        state['launch_lock'] = asyncio.Lock()
+    async with state['launch_lock']:
+        if 'playwright' not in state:
+            state['playwright'] = await async_playwright().start()
+        if 'profile_dir' not in state:
+            _sweep_stale_profiles()
+            state['profile_dir'] = tempfile.mkdtemp(prefix=f'{PROFILE_PREFIX}{os.getpid()}-')
+        context = state.get('context')
+        if context is None or not context.browser.is_connected():
+            context = await state['playwright'].chromium.launch_persistent_context(
+                state['profile_dir'],
+                headless=True,
+                args=BROWSER_ARGS,
+                user_agent=USER_AGENT,
+                viewport={'width': 1280, 'height': 800},
+                locale='en-US',
+            )
+            state['context'] = context
+        return context
+
+
+async def fetch_html_async(url, timeout=30):
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    context = await _get_context()
+    page = await context.new_page()
+    try:
+        await page.route('**/*', _block_heavy_resources)
+        await page.goto(url, wait_until='domcontentloaded', timeout=timeout * 1000)
+        try:
+            await page.wait_for_selector('input, form', state='attached', timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
+        return await page.content(), 200
+    finally:
+        await page.close()
+
+
+async def _close_browser():
+    state = app.extensions.get('playwright', {})
+    try:
+        if 'context' in state:
+            await state['context'].close()
+        if 'playwright' in state:
+            await state['playwright'].stop()
+    finally:
+        if 'profile_dir' in state:
+            shutil.rmtree(state['profile_dir'], ignore_errors=True)
+
+
+def _get_browser_loop():
+    with _browser_lock:
+        loop = app.extensions.get('browser_loop')
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='browser-loop', daemon=True).start()
+            app.extensions['browser_loop'] = loop
+    return loop
+
+
+@atexit.register
+def _stop_browser():
+    loop = app.extensions.get('browser_loop')
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_browser(), loop).result(timeout=10)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+def fetch_static_html(url, timeout):
+    try:
+        resp = HTTP.get(url, timeout=min(timeout, STATIC_TIMEOUT))
+    except http_requests.exceptions.RequestException:
+        return None
+    if resp.ok and STATIC_AUTH_RE.search(STATIC_HIDDEN_RE.sub('', resp.text)):
+        return resp.text, resp.status_code
+    return None
+
+
 def fetch_html(url, timeout=30):
-    from playwright.sync_api import sync_playwright
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage'
-            ]
-        )
-
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            viewport={'width': 1280, 'height': 800},
-            locale='en-US',
-        )
-
-        page = context.new_page()
-        page.goto(url, wait_until='domcontentloaded', timeout=timeout * 1000)
-        page.wait_for_timeout(3000)
-
-        html = page.content()
-        browser.close()
-
-    return html, 200
-    
-def check_attr_match(tag, keywords):
-    attrs_to_check = ['id', 'class', 'name', 'action', 'aria-label',
-                      'placeholder', 'data-testid', 'role', 'for', 'type']
-    for attr in attrs_to_check:
-        val = tag.get(attr, '')
-        if isinstance(val, list):
-            val = ' '.join(val)
-        val_lower = val.lower()
-        for kw in keywords:
-            if kw in val_lower:
-                return True
-    return False
-
-
-def detect_auth_components(html):
-    soup = BeautifulSoup(html, 'html.parser')
+    static = fetch_static_html(url, timeout)
+    if static is not None:
+        return static
+
+    future = asyncio.run_coroutine_threadsafe(fetch_html_async(url, timeout), _get_browser_loop())
+    return future.result()
+
+
+ATTRS_TO_CHECK = frozenset(['id', 'class', 'name', 'action', 'aria-label',
+                            'placeholder', 'data-testid', 'role', 'for', 'type'])
+
+CONTAINER_TAGS = ('div', 'section', 'main', 'aside')
+CONTAINER_KEYWORDS = ('login', 'signin', 'sign-in', 'auth', 'credentials')
+
+
+def keyword_re(keywords):
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+AUTH_KW_RE = keyword_re(AUTH_KEYWORDS)
+AUTH_PLACEHOLDER_RE = keyword_re(AUTH_KEYWORDS[:10])
+AUTH_INPUT_RE = keyword_re(AUTH_INPUT_NAMES)
+CONTAINER_KW_RE = keyword_re(CONTAINER_KEYWORDS)
+
+OAUTH_RE = re.compile(r'(sign\s*in|log\s*in|continue)\s*(with|using|via)', re.I)
+AUTH_HREF_PARTS = ('/auth/', '/login', '/sso', 'oauth')
+AUTH_TEXT_PARTS = ('sign in', 'log in', 'login', 'sign up')
+
+
+def attr_blob(tag):
+    return ' '.join(
+        ' '.join(val) if isinstance(val, list) else val
+        for attr, val in tag.attrs.items() if attr in ATTRS_TO_CHECK
+    ).lower()
+
+
+SNIPPET_CAP = 3000
+
+# Only these subtrees are built into the soup; top-level <script>/<style> and
+# other chrome around them never become Python objects. <noscript> is kept so
+# its fallback markup is built as one subtree and then decomposed, instead of
+# its forms surfacing as top-level matches.
+RELEVANT_TAGS = SoupStrainer(['form', 'input', 'div', 'section', 'main', 'aside', 'a', 'button', 'title', 'noscript'])
+
+
+def serialize_capped(elem, cap=SNIPPET_CAP):
+    # Emits the same text as str(elem), but stops once more than `cap`
+    # characters have been produced instead of serializing huge containers.
+    # Also returns whether the whole element was emitted.
+    parts, size = [], 0
+    stack = [elem]
+    while stack and size <= cap:
+        node = stack.pop()
+        if isinstance(node, Tag) and node.contents:
+            close = f'</{node.name}>'
+            piece = str(Tag(name=node.name, attrs=node.attrs))[:-len(close)]
+            stack.append(close)
+            stack.extend(reversed(node.contents))
+        elif isinstance(node, Tag):
+            piece = str(node)
+        elif isinstance(node, NavigableString):
+            piece = node.output_ready()
+        else:
+            piece = node
+        parts.append(piece)
+        size += len(piece)
+    return ''.join(parts), not stack
+
+
+def capped_snippet(elem):
+    text, complete = serialize_capped(elem)
+    # A cut-off element still has its closing tag pending, so the full text
+    # is longer than the cap even if the emitted part ends in whitespace.
+    snippet = text.strip() if complete else text.lstrip()
+    if not complete or len(snippet) > SNIPPET_CAP:
+        snippet = snippet[:SNIPPET_CAP] + '\n<!-- ... truncated ... -->'
+    return snippet
+
+
+def parse_html(html):
+    soup = BeautifulSoup(html, 'lxml', parse_only=RELEVANT_TAGS)
     for tag in soup.find_all(['script', 'style', 'noscript']):
         tag.decompose()
     for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
         comment.extract()
+    return soup
 
+
+def detect_auth_components(soup):
     components = []
     seen = set()
+    seen_elements = set()
 
     def add(comp_type, element, context):
-        snippet = str(element).strip()
-        if len(snippet) > 3000:
-            snippet = snippet[:3000] + '\n<!-- ... truncated ... -->'
-        key = hash(snippet[:200])
+        # The same element is often matched by several branches (a login form
+        # is both a password parent and an auth form); skip re-serializing it.
+        if id(element) in seen_elements:
+            return
+        seen_elements.add(id(element))
+        snippet = capped_snippet(element)
+        key = xxhash.xxh3_64_intdigest(snippet.encode('utf-8', 'ignore'))
         if key not in seen:
             seen.add(key)
             components.append({'type': comp_type, 'html_snippet': snippet, 'context': context})
 
-    for pwd in soup.find_all('input', attrs={'type': 'password'}):
+    # Classify every tag in a single walk; the branches below then run in
+    # their original priority order so dedup keeps the same labels.
+    passwords, forms, buttons = [], [], []
+    containers = {name: [] for name in CONTAINER_TAGS}
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        name = tag.name
+        if name == 'input':
+            if tag.get('type') == 'password':
+                passwords.append(tag)
+        elif name == 'form':
+            forms.append((tag, attr_blob(tag)))
+        elif name in containers:
+            containers[name].append((tag, attr_blob(tag)))
+        elif name in ('a', 'button'):
+            buttons.append(tag)
+
+    for pwd in passwords:
         parent_form = pwd.find_parent('form')
         if parent_form:
             add('Login Form (contains password field)', parent_form, 'Found <form> wrapping a password input')
@@ -119,8 +382,8 @@ def detect_auth_components(html):
             else:
                 add('Password Input Field', pwd, 'Standalone password input (no parent form detected)')
 
-    for form in soup.find_all('form'):
-        if check_attr_match(form, AUTH_KEYWORDS):
+    for form, blob in forms:
+        if AUTH_KW_RE.search(blob):
             add('Authentication Form', form, 'Form with auth-related attributes (id/class/action)')
         else:
             has_auth = False
@@ -128,31 +391,30 @@ def detect_auth_components(html):
                 name = (inp.get('name', '') or '').lower()
                 itype = (inp.get('type', '') or '').lower()
                 placeholder = (inp.get('placeholder', '') or '').lower()
-                if itype in ('password', 'email'): has_auth = True
-                if any(kw in name for kw in AUTH_INPUT_NAMES): has_auth = True
-                if any(kw in placeholder for kw in AUTH_KEYWORDS[:10]): has_auth = True
+                if (itype in ('password', 'email') or AUTH_INPUT_RE.search(name)
+                        or AUTH_PLACEHOLDER_RE.search(placeholder)):
+                    has_auth = True
+                    break
             if has_auth:
                 add('Authentication Form', form, 'Form contains auth-related input fields')
 
-    for tag_name in ['div', 'section', 'main', 'aside']:
-        for elem in soup.find_all(tag_name):
-            if check_attr_match(elem, ['login', 'signin', 'sign-in', 'auth', 'credentials']):
-                if elem.find_all('input'):
+    for tag_name, elems in containers.items():
+        for elem, blob in elems:
+            if CONTAINER_KW_RE.search(blob):
+                if elem.find('input'):
                     add('Auth Section / Container', elem, f'<{tag_name}> with auth-related class/id + input fields')
 
-    for btn in soup.find_all(['a', 'button']):
+    for btn in buttons:
         text = btn.get_text(strip=True)
-        if re.search(r'(sign\s*in|log\s*in|continue)\s*(with|using|via)', text, re.I):
+        if OAUTH_RE.search(text):
             add('OAuth / SSO Button', btn, 'Social or SSO login button')
-
-    for btn in soup.find_all(['a', 'button']):
         href = (btn.get('href', '') or '').lower()
-        text = btn.get_text(strip=True).lower()
-        if any(p in href for p in ['/auth/', '/login', '/sso', 'oauth']):
-            if any(kw in text for kw in ['sign in', 'log in', 'login', 'sign up']):
+        if any(p in href for p in AUTH_HREF_PARTS):
+            text_lower = text.lower()
+            if any(kw in text_lower for kw in AUTH_TEXT_PARTS):
                 add('Auth Link / Button', btn, 'Link pointing to auth endpoint')
 
-    types_found = list(set(c['type'] for c in components))
+    types_found = list(dict.fromkeys(c['type'] for c in components))
     summary = (
         f"Found {len(components)} auth component(s): {', '.join(types_found)}"
         if components else "No authentication components detected on this page."
@@ -160,15 +422,20 @@ def detect_auth_components(html):
     return {'found': len(components) > 0, 'components': components, 'summary': summary, 'total_found': len(components)}
 
 
+def analyze_html(html):
+    soup = parse_html(html)
+    title_tag = soup.find('title')
+    page_title = title_tag.get_text(strip=True) if title_tag else 'No title'
+    return page_title, detect_auth_components(soup)
+
+
 def scrape_and_detect(url):
     result = {'url': url, 'success': False, 'error': None, 'status_code': None, 'auth_result': None, 'page_title': None}
     try:
         html, status = fetch_html(url)
         result['status_code'] = status
         result['success'] = True
-        title_tag = BeautifulSoup(html, 'html.parser').find('title')
-        result['page_title'] = title_tag.get_text(strip=True) if title_tag else 'No title'
-        result['auth_result'] = detect_auth_components(html)
+        result['page_title'], result['auth_result'] = DETECT_POOL.submit(analyze_html, html).result()
     except http_requests.exceptions.Timeout:
         result['error'] = 'Request timed out — site took too long to respond.'
     except http_requests.exceptions.ConnectionError:
@@ -180,6 +447,60 @@ def scrape_and_detect(url):
     return result
 
 
+def timed_scan(url):
+    start = time.time()
+    result = scrape_and_detect(url)
+    result['scan_time'] = round(time.time() - start, 2)
+    return result
+
+
+def _scan_once(url):
+    try:
+        result = timed_scan(url)
+        if result['success']:
+            with _scan_lock:
+                SCAN_CACHE[url] = result
+        return result
+    finally:
+        with _scan_lock:
+            _inflight.pop(url, None)
+
+
+def submit_scan(url, fresh=False):
+    with _scan_lock:
+        cached = None if fresh else SCAN_CACHE.get(url)
+        if cached is not None:
+            future = Future()
+            future.set_result({**cached, 'cached': True})
+            return future
+        future = _inflight.get(url)
+        if future is None:
+            future = SCAN_EXECUTOR.submit(_scan_once, url)
+            _inflight[url] = future
+    return future
+
+
+# Only the fields the UI renders go over the wire; status_code and the
+# prose summary stay server-side.
+def _project(result):
+    auth_result = result['auth_result']
+    projected = {
+        'url': result['url'],
+        'page_title': result['page_title'],
+        'success': result['success'],
+        'error': result['error'],
+        'scan_time': result.get('scan_time'),
+        'auth_result': auth_result and {
+            'found': auth_result['found'],
+            'total_found': auth_result['total_found'],
+            'components': auth_result['components'],
+        },
+    }
+    if result.get('cached'):
+        projected['cached'] = True
+    return projected
+
+
 @app.route('/api/scan', methods=['POST'])
 def api_scan():
     data = request.get_json()
@@ -191,441 +512,62 @@ def api_scan():
     parsed = urlparse(url)
     if not parsed.netloc:
         return jsonify({'error': 'Invalid URL'}), 400
-    start = time.time()
-    result = scrape_and_detect(url)
-    result['scan_time'] = round(time.time() - start, 2)
-    return jsonify(result)
+    return jsonify(_project(submit_scan(url).result()))
 
 
 @app.route('/api/scan-defaults', methods=['GET'])
 def api_scan_defaults():
-    results = []
-    for url in DEFAULT_SITES:
-        start = time.time()
-        result = scrape_and_detect(url)
-        result['scan_time'] = round(time.time() - start, 2)
-        results.append(result)
-    return jsonify({
-        'results': results,
-        'total_scanned': len(results),
-        'sites_with_auth': sum(1 for r in results if r.get('auth_result', {}).get('found')),
-    })
+    fresh = request.args.get('fresh') == '1'
+    cached = _defaults_cache
+    if not fresh and cached['body'] is not None and time.time() - cached['ts'] < DEFAULTS_TTL:
+        return Response(cached['body'], content_type=NDJSON_TYPE)
+
+    futures = [submit_scan(url, fresh) for url in DEFAULT_SITES]
+
+    # One NDJSON line per site as soon as its scan finishes, then the summary.
+    def generate():
+        global _defaults_cache
+        lines = []
+        summary = {'total': 0, 'auth': 0, 'components': 0, 'errors': 0}
+        for future in as_completed(futures):
+            result = future.result()
+            auth_result = result.get('auth_result') or {}
+            summary['total'] += 1
+            summary['auth'] += auth_result.get('found', False)
+            summary['components'] += auth_result.get('total_found', 0)
+            summary['errors'] += not result['success']
+            lines.append(orjson.dumps({'result': _project(result)}, default=str) + b'\n')
+            yield lines[-1]
+        lines.append(orjson.dumps({'summary': summary}) + b'\n')
+        yield lines[-1]
+        if not summary['errors']:
+            _defaults_cache = {'ts': time.time(), 'body': b''.join(lines)}
+
+    return Response(generate(), content_type=NDJSON_TYPE)
+
+
+with open(os.path.join(app.static_folder, 'index.html'), 'rb') as f:
+    HTML_BYTES = f.read()
+HTML_GZ = gzip.compress(HTML_BYTES, 6)
+HTML_ETAG = hashlib.md5(HTML_BYTES).hexdigest()
 
 
 @app.route('/')
 def index():
-    return HTML_PAGE
-
-
-HTML_PAGE = r'''<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Auth Component Detector</title>
-<link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Share+Tech+Mono&family=Rajdhani:wght@400;500;600;700&display=swap" rel="stylesheet">
-<style>
-:root {
-  --red:#e8192c; --red2:#ff3344; --red-dim:rgba(232,25,44,0.15);
-  --red-glow:rgba(232,25,44,0.5); --black:#04060a;
-  --surface:rgba(10,13,20,0.95); --border:rgba(232,25,44,0.22);
-  --border2:rgba(255,255,255,0.06); --white:#f0f2f5;
-  --muted:#606672; --code-bg:#060810;
-}
-*{margin:0;padding:0;box-sizing:border-box;}
-html{scroll-behavior:smooth;}
-body{font-family:'Rajdhani',sans-serif;background:var(--black);color:var(--white);min-height:100vh;overflow-x:hidden;}
-
-#bgCanvas{position:fixed;inset:0;z-index:0;pointer-events:none;}
-.scanlines{position:fixed;inset:0;z-index:1;pointer-events:none;background:repeating-linear-gradient(0deg,transparent,transparent 3px,rgba(0,0,0,0.07) 3px,rgba(0,0,0,0.07) 4px);}
-.scan-beam{position:fixed;left:0;right:0;height:2px;background:linear-gradient(90deg,transparent 0%,var(--red) 50%,transparent 100%);z-index:2;pointer-events:none;animation:beamMove 7s linear infinite;opacity:0.35;filter:blur(1px);box-shadow:0 0 14px var(--red-glow);}
-@keyframes beamMove{0%{top:-2px;}100%{top:100vh;}}
-
-.corner{position:fixed;width:50px;height:50px;z-index:3;pointer-events:none;}
-.corner::before,.corner::after{content:'';position:absolute;background:var(--red);opacity:0.7;}
-.corner::before{width:100%;height:2px;top:0;left:0;}
-.corner::after{width:2px;height:100%;top:0;left:0;}
-.corner.tl{top:14px;left:14px;}
-.corner.tr{top:14px;right:14px;transform:scaleX(-1);}
-.corner.bl{bottom:14px;left:14px;transform:scaleY(-1);}
-.corner.br{bottom:14px;right:14px;transform:scale(-1);}
-
-.container{position:relative;z-index:10;max-width:1000px;margin:0 auto;padding:52px 28px 72px;}
-
-/* HEADER */
-header{text-align:center;margin-bottom:48px;animation:slideDown 0.8s ease both;}
-@keyframes slideDown{from{opacity:0;transform:translateY(-28px);}to{opacity:1;transform:translateY(0);}}
-.eyebrow{font-family:'Share Tech Mono',monospace;font-size:11px;color:var(--red);letter-spacing:5px;text-transform:uppercase;margin-bottom:12px;display:block;animation:fadeIn 0.8s ease 0.4s both;}
-@keyframes fadeIn{from{opacity:0;}to{opacity:1;}}
-.title-block{position:relative;display:inline-block;}
-h1{font-family:'Bebas Neue',sans-serif;font-size:76px;letter-spacing:7px;line-height:1;background:linear-gradient(100deg,#fff 0%,#fff 35%,var(--red2) 65%,#ff7080 100%);-webkit-background-clip:text;-webkit-text-fill-color:transparent;background-clip:text;position:relative;}
-h1::before,h1::after{content:attr(data-text);position:absolute;top:0;left:0;background-clip:text;-webkit-background-clip:text;-webkit-text-fill-color:transparent;}
-h1::before{background:linear-gradient(100deg,var(--red),transparent);animation:glA 5s infinite;clip-path:polygon(0 15%,100% 15%,100% 35%,0 35%);}
-h1::after{background:linear-gradient(100deg,#fff,var(--red2));animation:glB 5s infinite;clip-path:polygon(0 65%,100% 65%,100% 82%,0 82%);}
-@keyframes glA{0%,88%,100%{transform:translate(0);opacity:0;}90%{transform:translate(-4px,1px);opacity:0.7;}93%{transform:translate(4px,-1px);opacity:0.7;}95%{transform:translate(0);opacity:0;}}
-@keyframes glB{0%,85%,100%{transform:translate(0);opacity:0;}87%{transform:translate(4px,2px);opacity:0.6;}90%{transform:translate(-3px,-2px);opacity:0.6;}92%{transform:translate(0);opacity:0;}}
-
-.divider{display:flex;align-items:center;justify-content:center;gap:14px;margin:18px auto 20px;max-width:360px;}
-.divider::before{content:'';flex:1;height:1px;background:linear-gradient(90deg,transparent,var(--red));}
-.divider::after{content:'';flex:1;height:1px;background:linear-gradient(90deg,var(--red),transparent);}
-.diamond{width:9px;height:9px;background:var(--red);transform:rotate(45deg);box-shadow:0 0 12px var(--red-glow);animation:diamondPulse 2s ease-in-out infinite;}
-@keyframes diamondPulse{0%,100%{box-shadow:0 0 6px var(--red-glow);transform:rotate(45deg) scale(1);}50%{box-shadow:0 0 22px var(--red-glow);transform:rotate(45deg) scale(1.35);}}
-header p{color:var(--muted);font-size:15px;font-weight:400;letter-spacing:0.4px;max-width:500px;margin:0 auto;line-height:1.75;animation:fadeIn 0.8s ease 0.7s both;}
-
-/* STATS */
-.stats-row{display:grid;grid-template-columns:repeat(4,1fr);gap:12px;margin-bottom:22px;animation:slideUp 0.7s ease 0.3s both;}
-@keyframes slideUp{from{opacity:0;transform:translateY(18px);}to{opacity:1;transform:translateY(0);}}
-.stat-tile{background:var(--surface);border:1px solid var(--border2);border-radius:10px;padding:18px 12px;text-align:center;position:relative;overflow:hidden;transition:border-color 0.3s,transform 0.2s,box-shadow 0.3s;}
-.stat-tile::after{content:'';position:absolute;top:0;left:0;right:0;height:2px;background:linear-gradient(90deg,transparent,var(--red),transparent);transform:scaleX(0);transition:transform 0.4s;}
-.stat-tile:hover{border-color:var(--border);transform:translateY(-3px);box-shadow:0 8px 30px rgba(232,25,44,0.1);}
-.stat-tile:hover::after{transform:scaleX(1);}
-.stat-val{font-family:'Bebas Neue',sans-serif;font-size:38px;letter-spacing:2px;background:linear-gradient(135deg,#fff,var(--red));-webkit-background-clip:text;-webkit-text-fill-color:transparent;background-clip:text;line-height:1;}
-.stat-lbl{font-family:'Share Tech Mono',monospace;font-size:10px;color:var(--muted);text-transform:uppercase;letter-spacing:1.5px;margin-top:5px;}
-
-/* INPUT */
-.input-section{background:var(--surface);border:1px solid var(--border);border-radius:14px;padding:28px;margin-bottom:26px;position:relative;overflow:hidden;box-shadow:0 0 60px rgba(232,25,44,0.07),0 20px 60px rgba(0,0,0,0.5);animation:slideUp 0.7s ease 0.15s both;}
-.input-section::before{content:'';position:absolute;inset:0;border-radius:14px;background:linear-gradient(135deg,rgba(232,25,44,0.05) 0%,transparent 55%);pointer-events:none;}
-.section-label{font-family:'Share Tech Mono',monospace;font-size:10px;color:var(--red);letter-spacing:3px;text-transform:uppercase;margin-bottom:16px;display:flex;align-items:center;gap:10px;}
-.section-label::after{content:'';flex:1;height:1px;background:linear-gradient(90deg,var(--border),transparent);}
-.input-row{display:flex;gap:10px;margin-bottom:20px;}
-.url-wrapper{flex:1;position:relative;}
-.url-prefix{position:absolute;left:14px;top:50%;transform:translateY(-50%);color:var(--red);font-family:'Share Tech Mono',monospace;font-size:12px;pointer-events:none;opacity:0.6;}
-.input-row input[type="text"]{width:100%;padding:14px 16px 14px 68px;font-size:14px;font-family:'Share Tech Mono',monospace;background:var(--code-bg);border:1px solid var(--border2);border-radius:8px;color:var(--white);outline:none;transition:border-color 0.25s,box-shadow 0.25s;letter-spacing:0.3px;}
-.input-row input[type="text"]:focus{border-color:var(--red);box-shadow:0 0 0 3px rgba(232,25,44,0.12),inset 0 0 20px rgba(232,25,44,0.03);}
-.input-row input[type="text"]::placeholder{color:#22262e;}
-.btn{padding:14px 28px;font-size:13px;font-weight:700;font-family:'Rajdhani',sans-serif;letter-spacing:1.5px;text-transform:uppercase;border:none;border-radius:8px;cursor:pointer;transition:all 0.2s;white-space:nowrap;position:relative;overflow:hidden;}
-.btn::after{content:'';position:absolute;inset:0;background:linear-gradient(135deg,rgba(255,255,255,0.12) 0%,transparent 60%);opacity:0;transition:opacity 0.2s;}
-.btn:hover::after{opacity:1;}
-.btn-primary{background:linear-gradient(135deg,var(--red),#8a0f1a);color:#fff;box-shadow:0 4px 20px var(--red-glow),inset 0 1px 0 rgba(255,255,255,0.12);}
-.btn-primary:hover{transform:translateY(-2px);box-shadow:0 8px 32px var(--red-glow);}
-.btn-primary:active{transform:translateY(0);}
-.btn-primary:disabled{background:#180810;color:#38141a;box-shadow:none;cursor:not-allowed;transform:none;}
-.btn-secondary{background:transparent;color:var(--white);border:1px solid var(--border);}
-.btn-secondary:hover{border-color:var(--red);color:var(--red);background:var(--red-dim);transform:translateY(-1px);}
-.btn-secondary:disabled{opacity:0.35;cursor:not-allowed;transform:none;}
-.demo-row{display:flex;align-items:center;gap:14px;flex-wrap:wrap;margin-bottom:14px;}
-.demo-label{font-family:'Share Tech Mono',monospace;color:var(--muted);font-size:11px;letter-spacing:2px;text-transform:uppercase;}
-.demo-chips{display:flex;gap:8px;flex-wrap:wrap;}
-.chip{padding:5px 16px;font-size:12px;font-family:'Share Tech Mono',monospace;background:transparent;border:1px solid var(--border2);border-radius:4px;color:var(--muted);cursor:pointer;transition:all 0.2s;letter-spacing:0.5px;position:relative;overflow:hidden;}
-.chip::before{content:'';position:absolute;left:0;top:0;bottom:0;width:2px;background:var(--red);transform:scaleY(0);transition:transform 0.2s;}
-.chip:hover{border-color:var(--red);color:var(--red);background:var(--red-dim);}
-.chip:hover::before{transform:scaleY(1);}
-
-/* RESULTS */
-.results-area{min-height:220px;}
-.status-msg{text-align:center;padding:70px 20px;color:var(--muted);font-size:14px;font-family:'Share Tech Mono',monospace;}
-.status-icon{font-size:40px;display:block;margin-bottom:18px;animation:float 3s ease-in-out infinite;}
-@keyframes float{0%,100%{transform:translateY(0);}50%{transform:translateY(-9px);}}
-.hint{display:block;margin-top:10px;font-size:11px;color:#1e222a;letter-spacing:1px;}
-
-.loading-wrap{text-align:center;padding:70px 20px;}
-.loading-text{font-family:'Share Tech Mono',monospace;font-size:13px;color:var(--red);letter-spacing:2px;text-transform:uppercase;margin-bottom:20px;animation:textPulse 1.5s ease-in-out infinite;}
-@keyframes textPulse{0%,100%{opacity:1;}50%{opacity:0.4;}}
-.loading-bar{width:220px;height:2px;background:#111;margin:0 auto;border-radius:2px;overflow:hidden;}
-.loading-bar-fill{height:100%;width:30%;background:linear-gradient(90deg,transparent,var(--red),transparent);animation:barScan 1.2s ease-in-out infinite;}
-@keyframes barScan{0%{transform:translateX(-200%);}100%{transform:translateX(400%);}}
-
-/* CARDS */
-.result-card{background:var(--surface);border:1px solid var(--border2);border-radius:12px;margin-bottom:14px;overflow:hidden;transition:border-color 0.25s,box-shadow 0.25s,transform 0.2s;animation:cardIn 0.5s ease both;}
-@keyframes cardIn{from{opacity:0;transform:translateY(14px);}to{opacity:1;transform:translateY(0);}}
-.result-card:hover{border-color:var(--border);box-shadow:0 0 28px rgba(232,25,44,0.06);transform:translateY(-1px);}
-.result-header{padding:18px 22px;display:flex;justify-content:space-between;align-items:center;cursor:pointer;transition:background 0.15s;}
-.result-header:hover{background:rgba(232,25,44,0.02);}
-.result-header-left h3{font-size:15px;font-weight:600;color:var(--white);margin-bottom:5px;letter-spacing:0.3px;}
-.url-text{font-size:11px;font-family:'Share Tech Mono',monospace;color:var(--red);opacity:0.7;word-break:break-all;}
-.result-meta{display:flex;gap:12px;align-items:center;flex-shrink:0;}
-.badge{padding:4px 12px;border-radius:3px;font-size:10px;font-weight:700;letter-spacing:1px;text-transform:uppercase;font-family:'Share Tech Mono',monospace;}
-.badge-found{background:rgba(232,25,44,0.15);color:#ff4455;border:1px solid rgba(232,25,44,0.35);box-shadow:0 0 10px rgba(232,25,44,0.15);}
-.badge-none{background:rgba(255,255,255,0.04);color:var(--muted);border:1px solid var(--border2);}
-.badge-error{background:rgba(255,120,40,0.1);color:#ff8040;border:1px solid rgba(255,120,40,0.3);}
-.scan-time{font-size:11px;font-family:'Share Tech Mono',monospace;color:#2a2f38;}
-.expand-icon{color:var(--muted);font-size:12px;transition:transform 0.3s;opacity:0.4;}
-.expand-icon.rotated{transform:rotate(90deg);opacity:0.8;}
-.result-body{padding:0 22px;max-height:0;overflow:hidden;transition:max-height 0.45s ease,padding 0.3s;}
-.result-body.open{max-height:3000px;padding:20px 22px;}
-.component-item{margin-bottom:22px;padding-bottom:22px;border-bottom:1px solid rgba(255,255,255,0.04);animation:fadeIn 0.4s ease both;}
-.component-item:last-child{margin-bottom:0;padding-bottom:0;border-bottom:none;}
-.component-label{font-size:11px;font-weight:700;color:var(--red);text-transform:uppercase;letter-spacing:2px;margin-bottom:6px;font-family:'Share Tech Mono',monospace;display:flex;align-items:center;gap:8px;}
-.component-label::before{content:'▸';}
-.component-context{font-size:13px;color:var(--muted);margin-bottom:12px;font-style:italic;padding-left:16px;border-left:2px solid var(--border2);}
-.code-block{background:var(--code-bg);border:1px solid rgba(255,255,255,0.05);border-left:3px solid var(--red);border-radius:6px;padding:16px;overflow-x:auto;max-height:280px;overflow-y:auto;position:relative;}
-.code-block::before{content:'HTML';position:absolute;top:8px;right:12px;font-family:'Share Tech Mono',monospace;font-size:9px;color:var(--red);opacity:0.4;letter-spacing:2px;}
-.code-block pre{font-family:'Share Tech Mono',monospace;font-size:12px;color:#7080a0;white-space:pre-wrap;word-break:break-word;line-height:1.75;}
-.error-msg{color:#ff8040;font-size:13px;font-family:'Share Tech Mono',monospace;padding:8px 0;}
-.none-msg{color:var(--muted);font-size:14px;line-height:1.75;font-style:italic;padding:8px 0;}
-
-/* SUMMARY */
-.summary-bar{background:var(--surface);border:1px solid var(--border);border-radius:12px;padding:22px 28px;margin-bottom:20px;display:flex;justify-content:space-around;box-shadow:0 0 40px rgba(232,25,44,0.07);animation:slideUp 0.5s ease both;}
-.summary-bar .stat{text-align:center;}
-.summary-bar .stat-val{font-family:'Bebas Neue',sans-serif;font-size:40px;letter-spacing:2px;background:linear-gradient(135deg,#fff,var(--red));-webkit-background-clip:text;-webkit-text-fill-color:transparent;background-clip:text;line-height:1;}
-.summary-bar .stat-label{font-size:11px;color:var(--muted);margin-top:5px;text-transform:uppercase;letter-spacing:1px;font-family:'Share Tech Mono',monospace;}
-
-/* FOOTER */
-footer{text-align:center;margin-top:60px;padding-top:28px;border-top:1px solid rgba(255,255,255,0.04);color:#2a2f38;font-size:12px;font-family:'Share Tech Mono',monospace;letter-spacing:1px;animation:fadeIn 1s ease 1s both;}
-footer a{color:var(--red);text-decoration:none;opacity:0.6;transition:opacity 0.2s,text-shadow 0.2s;}
-footer a:hover{opacity:1;text-shadow:0 0 12px var(--red-glow);}
-
-::-webkit-scrollbar{width:4px;height:4px;}
-::-webkit-scrollbar-track{background:var(--black);}
-::-webkit-scrollbar-thumb{background:var(--red);border-radius:2px;}
-
-@media(max-width:640px){
-  h1{font-size:50px;}
-  .stats-row{grid-template-columns:repeat(2,1fr);}
-  .input-row{flex-direction:column;}
-  .corner{display:none;}
-}
-</style>
-</head>
-<body>
-
-<canvas id="bgCanvas"></canvas>
-<div class="scanlines"></div>
-<div class="scan-beam"></div>
-<div class="corner tl"></div>
-<div class="corner tr"></div>
-<div class="corner bl"></div>
-<div class="corner br"></div>
-
-<div class="container">
-  <header>
-    <span class="eyebrow">// security intelligence tool v2.0</span>
-    <div class="title-block">
-      <h1 data-text="AUTH DETECTOR">AUTH DETECTOR</h1>
-    </div>
-    <div class="divider"><div class="diamond"></div></div>
-    <p>Scan any website URL to extract login forms, password fields, OAuth buttons, and authentication components from its live HTML.</p>
-  </header>
-
-  <div class="stats-row">
-    <div class="stat-tile"><div class="stat-val" id="st-scanned">0</div><div class="stat-lbl">Scanned</div></div>
-    <div class="stat-tile"><div class="stat-val" id="st-auth">0</div><div class="stat-lbl">Auth Found</div></div>
-    <div class="stat-tile"><div class="stat-val" id="st-comps">0</div><div class="stat-lbl">Components</div></div>
-    <div class="stat-tile"><div class="stat-val" id="st-errors">0</div><div class="stat-lbl">Errors</div></div>
-  </div>
-
-  <div class="input-section">
-    <div class="section-label">Target URL</div>
-    <div class="input-row">
-      <div class="url-wrapper">
-        <span class="url-prefix">https://</span>
-        <input type="text" id="urlInput" placeholder="www.example.com/login" autocomplete="off" spellcheck="false"/>
-      </div>
-      <button class="btn btn-primary" id="scanBtn" onclick="scanSingle()">&#9654; Scan URL</button>
-    </div>
-    <div class="demo-row">
-      <button class="btn btn-secondary" id="demoBtn" onclick="scanDefaults()">Scan 5 Demo Sites</button>
-      <span class="demo-label">— or pick one:</span>
-    </div>
-    <div class="demo-chips">
-      <span class="chip" onclick="quick('https://github.com/login')">GitHub</span>
-      <span class="chip" onclick="quick('https://www.linkedin.com/login')">LinkedIn</span>
-      <span class="chip" onclick="quick('https://www.facebook.com/login')">Facebook</span>
-      <span class="chip" onclick="quick('https://login.salesforce.com/')">Salesforce</span>
-      <span class="chip" onclick="quick('https://x.com/login')">X</span>
-    </div>
-  </div>
-
-  <div class="results-area" id="results">
-    <div class="status-msg">
-      <span class="status-icon">&#128269;</span>
-      AWAITING TARGET URL
-      <span class="hint">// enter a url above to begin scanning</span>
-    </div>
-  </div>
-
-  <footer>
-    Built by Tanishq Mekala &nbsp;&middot;&nbsp;
-    <a href="https://www.linkedin.com/in/tanishqmekala/" target="_blank">LinkedIn</a>
-  </footer>
-</div>
-
-<script>
-/* Particle canvas */
-(function(){
-  const cv=document.getElementById('bgCanvas');
-  const cx=cv.getContext('2d');
-  let W,H,pts=[];
-  function resize(){W=cv.width=innerWidth;H=cv.height=innerHeight;}
-  class P{
-    constructor(){this.reset(true);}
-    reset(init){
-      this.x=Math.random()*W;
-      this.y=init?Math.random()*H:(Math.random()>0.5?-4:H+4);
-      this.vx=(Math.random()-0.5)*0.5;this.vy=(Math.random()-0.5)*0.5;
-      this.r=Math.random()*1.8+0.3;this.a=Math.random()*0.55+0.08;
-      this.red=Math.random()>0.65;
-    }
-    move(){this.x+=this.vx;this.y+=this.vy;if(this.x<-10||this.x>W+10||this.y<-10||this.y>H+10)this.reset(false);}
-    draw(){
-      cx.beginPath();cx.arc(this.x,this.y,this.r,0,Math.PI*2);
-      cx.fillStyle=this.red?`rgba(232,25,44,${this.a})`:`rgba(160,170,190,${this.a*0.35})`;
-      cx.fill();
-    }
-  }
-  function init(){resize();pts=Array.from({length:130},()=>new P());}
-  function connect(){
-    for(let i=0;i<pts.length;i++){
-      for(let j=i+1;j<pts.length;j++){
-        const dx=pts[i].x-pts[j].x,dy=pts[i].y-pts[j].y;
-        const d=Math.sqrt(dx*dx+dy*dy);
-        if(d<110){
-          cx.beginPath();cx.moveTo(pts[i].x,pts[i].y);cx.lineTo(pts[j].x,pts[j].y);
-          cx.strokeStyle=`rgba(232,25,44,${(1-d/110)*0.1})`;cx.lineWidth=0.5;cx.stroke();
-        }
-      }
-    }
-  }
-  function frame(){
-    cx.clearRect(0,0,W,H);
-    cx.strokeStyle='rgba(232,25,44,0.022)';cx.lineWidth=0.5;
-    const gs=80;
-    for(let x=0;x<W;x+=gs){cx.beginPath();cx.moveTo(x,0);cx.lineTo(x,H);cx.stroke();}
-    for(let y=0;y<H;y+=gs){cx.beginPath();cx.moveTo(0,y);cx.lineTo(W,y);cx.stroke();}
-    connect();pts.forEach(p=>{p.move();p.draw();});
-    requestAnimationFrame(frame);
-  }
-  window.addEventListener('resize',()=>{resize();pts.forEach(p=>p.reset(true));});
-  init();frame();
-})();
-
-/* App */
-const results=document.getElementById('results');
-const urlInput=document.getElementById('urlInput');
-const scanBtn=document.getElementById('scanBtn');
-const demoBtn=document.getElementById('demoBtn');
-let totalScanned=0,totalAuth=0,totalComps=0,totalErrors=0;
-
-function updateStats(s,a,c,e){
-  totalScanned+=s;totalAuth+=a;totalComps+=c;totalErrors+=e;
-  animCount('st-scanned',totalScanned);animCount('st-auth',totalAuth);
-  animCount('st-comps',totalComps);animCount('st-errors',totalErrors);
-}
-function animCount(id,target){
-  const el=document.getElementById(id);
-  const start=parseInt(el.textContent)||0;
-  const dur=600,t0=performance.now();
-  function tick(now){
-    const p=Math.min((now-t0)/dur,1);
-    el.textContent=Math.round(start+(target-start)*p);
-    if(p<1)requestAnimationFrame(tick);
-  }
-  requestAnimationFrame(tick);
-}
-
-urlInput.addEventListener('keydown',e=>{if(e.key==='Enter')scanSingle();});
-function esc(s){const d=document.createElement('div');d.textContent=s;return d.innerHTML;}
-
-function loading(msg){
-  results.innerHTML=`<div class="loading-wrap"><div class="loading-text">${esc(msg)}</div><div class="loading-bar"><div class="loading-bar-fill"></div></div></div>`;
-  scanBtn.disabled=true;demoBtn.disabled=true;
-}
-function done(){scanBtn.disabled=false;demoBtn.disabled=false;}
-
-function toggleCard(i){
-  const b=document.getElementById('body-'+i);
-  const ic=document.getElementById('icon-'+i);
-  if(b)b.classList.toggle('open');
-  if(ic)ic.classList.toggle('rotated');
-}
-
-function card(r,i){
-  const err=!r.success;
-  const ar=r.auth_result||{};
-  const found=ar.found||false;
-  const comps=ar.components||[];
-  let badge;
-  if(err)badge='<span class="badge badge-error">Error</span>';
-  else if(found)badge='<span class="badge badge-found">'+comps.length+' Found</span>';
-  else badge='<span class="badge badge-none">None Found</span>';
-  let body;
-  if(err){body='<div class="error-msg">&#9888; '+esc(r.error||'Unknown error')+'</div>';}
-  else if(found){
-    body=comps.map(c=>`
-      <div class="component-item">
-        <div class="component-label">${esc(c.type)}</div>
-        <div class="component-context">${esc(c.context)}</div>
-        <div class="code-block"><pre>${esc(c.html_snippet)}</pre></div>
-      </div>`).join('');
-  } else {
-    body='<div class="none-msg">No auth components detected. The site may load its login form via JavaScript (SPA), or this page has no login section.</div>';
-  }
-  return `
-  <div class="result-card" id="card-${i}" style="animation-delay:${i*0.08}s">
-    <div class="result-header" onclick="toggleCard(${i})">
-      <div class="result-header-left">
-        <h3>${esc(r.page_title||'Unknown Page')}</h3>
-        <div class="url-text">${esc(r.url)}</div>
-      </div>
-      <div class="result-meta">
-        ${badge}
-        <span class="scan-time">${r.scan_time||0}s</span>
-        <span class="expand-icon" id="icon-${i}">&#9654;</span>
-      </div>
-    </div>
-    <div class="result-body" id="body-${i}">${body}</div>
-  </div>`;
-}
-
-function summaryBar(list){
-  const tot=list.length;
-  const auth=list.filter(r=>r.auth_result&&r.auth_result.found).length;
-  const errs=list.filter(r=>!r.success).length;
-  const comps=list.reduce((s,r)=>s+(r.auth_result?r.auth_result.total_found||0:0),0);
-  return `<div class="summary-bar">
-    <div class="stat"><div class="stat-val">${tot}</div><div class="stat-label">Sites Scanned</div></div>
-    <div class="stat"><div class="stat-val">${auth}</div><div class="stat-label">Auth Detected</div></div>
-    <div class="stat"><div class="stat-val">${comps}</div><div class="stat-label">Components</div></div>
-    <div class="stat"><div class="stat-val">${errs}</div><div class="stat-label">Errors</div></div>
-  </div>`;
-}
-
-async function scanSingle(){
-  let url=urlInput.value.trim();
-  if(!url){urlInput.focus();return;}
-  if(!url.startsWith('http://')&&!url.startsWith('https://'))url='https://'+url;
-  loading('Scanning '+url+' ...');
-  try{
-    const resp=await fetch('/api/scan',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify({url})});
-    const data=await resp.json();
-    if(resp.ok){
-      updateStats(1,data.auth_result?.found?1:0,data.auth_result?.total_found||0,data.success?0:1);
-      results.innerHTML=card(data,0);toggleCard(0);
-    } else {
-      results.innerHTML='<div class="status-msg" style="color:#ff7040;">'+esc(data.error||'Error')+'</div>';
-    }
-  } catch(e){
-    results.innerHTML='<div class="status-msg" style="color:#ff7040;">Could not reach server. Make sure app.py is running.</div>';
-  }
-  done();
-}
-
-function quick(url){urlInput.value=url;scanSingle();}
-
-async function scanDefaults(){
-  loading('Scanning 5 demo sites — takes ~20 seconds...');
-  try{
-    const resp=await fetch('/api/scan-defaults');
-    const data=await resp.json();
-    const auth=data.results.filter(r=>r.auth_result&&r.auth_result.found).length;
-    const comps=data.results.reduce((s,r)=>s+(r.auth_result?r.auth_result.total_found||0:0),0);
-    const errs=data.results.filter(r=>!r.success).length;
-    updateStats(data.results.length,auth,comps,errs);
-    let html=summaryBar(data.results);
-    data.results.forEach((r,i)=>{html+=card(r,i);});
-    results.innerHTML=html;
-  } catch(e){
-    results.innerHTML='<div class="status-msg" style="color:#ff7040;">Could not reach server. Make sure app.py is running.</div>';
-  }
-  done();
-}
-</script>
-</body>
-</html>'''
+    if request.if_none_match.contains_weak(HTML_ETAG):
+        resp = Response(status=304)
+    elif 'gzip' in request.headers.get('Accept-Encoding', ''):
+        resp = Response(HTML_GZ, mimetype='text/html')
+        resp.headers['Content-Encoding'] = 'gzip'
+    else:
+        resp = Response(HTML_BYTES, mimetype='text/html')
+    resp.set_etag(HTML_ETAG, weak=True)
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    resp.headers['Vary'] = 'Accept-Encoding'
+    return resp
 
 
 if __name__ == '__main__':
-    import os
     print()
     print('=' * 50)
     print('  Auth Component Detector is running!')
@@ -0,0 +1,12 @@
+import os
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '5000')
+
+# Threaded workers rather than gevent: monkey-patching would break the
+# asyncio loop thread that drives Playwright.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# A cold demo scan launches Chromium and visits five sites.
+timeout = 120
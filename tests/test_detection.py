@@ -0,0 +1,49 @@
+from bs4 import BeautifulSoup, Comment
+
+from app import analyze_html, detect_auth_components
+
+PAGE = '''<html><head><title>Sign in</title>
+<style>.login-wrap{display:none}</style>
+<script>var tpl = '<form action="/login"><input type="password"></form>';</script>
+</head><body>
+<noscript><div class="login-wrap"><form action="/login"><input type=password></form></div></noscript>
+<!-- <form action="/signin"><input type="password"></form> -->
+<div id="root">
+  <section class="auth-panel">
+    <form id="login-form" action="/session">
+      <script>document.write('<input type="password">')</script>
+      <!-- username field -->
+      <input name="username"><input type="password" name="pass">
+      <button>Sign in with Google</button>
+    </form>
+  </section>
+  <a href="/signup">Create account</a>
+  <noscript><a href="/login">Log in</a></noscript>
+</div>
+</body></html>'''
+
+NOSCRIPT_ONLY = '''<html><body>
+<noscript><div class="login-wrap"><form action="/login"><input type=password></form></div></noscript>
+<div id=root></div>
+</body></html>'''
+
+
+def full_parse(html):
+    soup = BeautifulSoup(html, 'lxml')
+    for tag in soup.find_all(['script', 'style', 'noscript']):
+        tag.decompose()
+    for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
+        comment.extract()
+    title_tag = soup.find('title')
+    page_title = title_tag.get_text(strip=True) if title_tag else 'No title'
+    return page_title, detect_auth_components(soup)
+
+
+def test_matches_full_parse_with_noscript_scripts_and_comments():
+    assert analyze_html(PAGE) == full_parse(PAGE)
+    assert analyze_html(PAGE)[1]['found']
+
+
+def test_noscript_fallback_form_is_not_reported():
+    assert analyze_html(NOSCRIPT_ONLY) == full_parse(NOSCRIPT_ONLY)
+    assert not analyze_html(NOSCRIPT_ONLY)[1]['found']
@@ -0,0 +1,26 @@
+from bs4 import BeautifulSoup
+
+from app import SNIPPET_CAP, capped_snippet
+
+
+def baseline_snippet(elem):
+    snippet = str(elem).strip()
+    if len(snippet) > SNIPPET_CAP:
+        snippet = snippet[:SNIPPET_CAP] + '\n<!-- ... truncated ... -->'
+    return snippet
+
+
+def test_matches_full_serialization_around_the_cap():
+    for filler in range(SNIPPET_CAP - 60, SNIPPET_CAP + 10):
+        for tail in ('', '\n', '\n   \n', '<input name="email"/>', '\n<b>x</b>\n'):
+            html = f'<form><span>{"x" * filler}</span>{tail}</form>'
+            form = BeautifulSoup(html, 'lxml').form
+            assert capped_snippet(form) == baseline_snippet(form), (filler, tail)
+
+
+def test_whitespace_piece_crossing_the_cap_keeps_marker():
+    prefix = '<form><span>'
+    filler = SNIPPET_CAP - len(prefix) - len('</span>')
+    form = BeautifulSoup(f'{prefix}{"x" * filler}</span>\n</form>', 'lxml').form
+    assert len(str(form)) > SNIPPET_CAP
+    assert capped_snippet(form).endswith('</span>\n<!-- ... truncated ... -->')